@@ -0,0 +1,26 @@
+"""
+This module contains code used for benchmarking the generation of setpoints
+by the sweep classes used with ``dond``.
+"""
+from qcodes import ManualParameter
+from qcodes.dataset import LinSweep, LogSweep
+
+
+class SweepSetpoints:
+    """
+    This benchmark measures how much time it takes to construct a sweep and
+    get its setpoints. Parametrization is used to alter the number of points,
+    from sizes typical of a measurement loop to very large sweeps.
+    """
+
+    params = [10, 1000, 1_000_000]
+    param_names = ["num_points"]
+
+    def setup(self, num_points):
+        self.parameter = ManualParameter("x")
+
+    def time_lin_sweep(self, num_points):
+        LinSweep(self.parameter, 0, 1, num_points).get_setpoints()
+
+    def time_log_sweep(self, num_points):
+        LogSweep(self.parameter, -3, 3, num_points).get_setpoints()
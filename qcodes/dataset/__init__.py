@@ -18,7 +18,7 @@ from .dond.do_0d import do0d
 from .dond.do_1d import do1d
 from .dond.do_2d import do2d
 from .dond.do_nd import dond
-from .dond.sweeps import AbstractSweep, ArraySweep, LinSweep, LogSweep
+from .dond.sweeps import AbstractSweep, ArraySweep, GeomSweep, LinSweep, LogSweep
 from .experiment_container import (
     experiments,
     load_experiment,
@@ -51,6 +51,7 @@ __all__ = [
     "ConnectionPlus",
     "DataSetProtocol",
     "DataSetType",
+    "GeomSweep",
     "LinSweep",
     "LogSweep",
     "Measurement",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any, Generic, TypeVar
 
 import numpy as np
@@ -13,11 +13,48 @@ from qcodes.parameters import ParameterBase
 T = TypeVar("T", bound=np.generic)
 
 
+def _linspace(
+    start: float, stop: float, num_points: int, endpoint: bool = True
+) -> npt.NDArray[np.float64]:
+    """
+    Evenly spaced float64 array from start to stop. Equivalent to
+    ``np.linspace(start, stop, num_points, endpoint=endpoint)`` but avoids
+    the overhead of the generic numpy wrapper, which dominates for the small
+    arrays typical of sweeps.
+    """
+    if num_points < 0:
+        raise ValueError(
+            f"Number of samples, {num_points}, must be non-negative."
+        )
+    div = num_points - 1 if endpoint else num_points
+    if div < 1:
+        return np.full(num_points, start, dtype=np.float64)
+    step = (stop - start) / div
+    setpoints = np.arange(num_points, dtype=np.float64)
+    setpoints *= step
+    setpoints += start
+    if endpoint:
+        setpoints[-1] = stop
+    return setpoints
+
+
 class AbstractSweep(ABC, Generic[T]):
     """
     Abstract sweep class that defines an interface for concrete sweep classes.
+
+    Attributes:
+        param: The Qcodes sweep parameter.
+        delay: Delay between two consecutive sweep points.
+        num_points: Number of sweep points.
+        post_actions: Actions to be performed after setting param to its
+            setpoint.
     """
 
+    param: ParameterBase
+    delay: float
+    num_points: int
+    post_actions: ActionsT
+
     @abstractmethod
     def get_setpoints(self) -> npt.NDArray[T]:
         """
@@ -25,40 +62,42 @@ class AbstractSweep(ABC, Generic[T]):
         """
         pass
 
-    @property
-    @abstractmethod
-    def param(self) -> ParameterBase:
-        """
-        Returns the Qcodes sweep parameter.
+    def fill_setpoints(self, out: np.ndarray) -> None:
         """
-        pass
+        Writes the setpoint values of this sweep into a preallocated array,
+        casting them to the dtype of ``out`` if needed.
 
-    @property
-    @abstractmethod
-    def delay(self) -> float:
-        """
-        Delay between two consecutive sweep points.
-        """
-        pass
+        Args:
+            out: One dimensional array with ``num_points`` elements.
 
-    @property
-    @abstractmethod
-    def num_points(self) -> int:
+        Raises:
+            ValueError: If ``out`` does not have the shape of the setpoints.
         """
-        Number of sweep points.
+        setpoints = self.get_setpoints()
+        if out.shape != setpoints.shape:
+            raise ValueError(
+                f"Expected an array of shape {setpoints.shape}, got {out.shape}"
+            )
+        np.copyto(out, setpoints, casting="same_kind")
+
+    def get_setpoints_batched(self, chunk_size: int) -> Iterator[npt.NDArray[T]]:
         """
-        pass
+        Yields consecutive blocks of at most ``chunk_size`` setpoints. The
+        blocks are views into the array returned by ``get_setpoints``, which
+        allows instruments that accept arrays of values to be fed a whole
+        block at a time.
 
-    @property
-    @abstractmethod
-    def post_actions(self) -> ActionsT:
-        """
-        actions to be performed after setting param to its setpoint.
+        Args:
+            chunk_size: Maximum number of setpoints per block.
         """
-        pass
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        setpoints = self.get_setpoints()
+        for start in range(0, setpoints.shape[0], chunk_size):
+            yield setpoints[start : start + chunk_size]
 
 
-class LinSweep(AbstractSweep[np.float64]):
+class LinSweep(AbstractSweep[np.floating[Any]]):
     """
     Linear sweep.
 
@@ -68,6 +107,10 @@ class LinSweep(AbstractSweep[np.float64]):
         stop: Sweep end value.
         num_points: Number of sweep points.
         delay: Time in seconds between two consecutive sweep points
+        dtype: Data type of the setpoints, e.g. ``np.float32`` for
+            instruments that take single precision values.
+        endpoint: If False, ``stop`` is not included in the setpoints, as
+            for ``np.linspace``.
     """
 
     def __init__(
@@ -78,39 +121,33 @@ class LinSweep(AbstractSweep[np.float64]):
         num_points: int,
         delay: float = 0,
         post_actions: ActionsT = (),
+        dtype: npt.DTypeLike = np.float64,
+        endpoint: bool = True,
     ):
-        self._param = param
+        self.param = param
         self._start = start
         self._stop = stop
-        self._num_points = num_points
-        self._delay = delay
-        self._post_actions = post_actions
-
-    def get_setpoints(self) -> npt.NDArray[np.float64]:
+        self._dtype = np.dtype(dtype)
+        self._endpoint = endpoint
+        self.delay = delay
+        self.post_actions = post_actions
+        setpoints = _linspace(start, stop, num_points, endpoint)
+        if np.issubdtype(self._dtype, np.integer):
+            # np.linspace rounds towards minus infinity for integer dtypes
+            np.floor(setpoints, out=setpoints)
+        self._setpoints = setpoints.astype(self._dtype, copy=False)
+        self._setpoints.setflags(write=False)
+        self.num_points = self._setpoints.shape[0]
+
+    def get_setpoints(self) -> npt.NDArray[np.floating[Any]]:
         """
         Linear (evenly spaced) numpy array for supplied start, stop and
-        num_points.
+        num_points. The returned array is read-only.
         """
-        return np.linspace(self._start, self._stop, self._num_points)
-
-    @property
-    def param(self) -> ParameterBase:
-        return self._param
+        return self._setpoints
 
-    @property
-    def delay(self) -> float:
-        return self._delay
 
-    @property
-    def num_points(self) -> int:
-        return self._num_points
-
-    @property
-    def post_actions(self) -> ActionsT:
-        return self._post_actions
-
-
-class LogSweep(AbstractSweep[np.float64]):
+class LogSweep(AbstractSweep[np.floating[Any]]):
     """
     Logarithmic sweep.
 
@@ -120,6 +157,10 @@ class LogSweep(AbstractSweep[np.float64]):
         stop: Sweep end value.
         num_points: Number of sweep points.
         delay: Time in seconds between two consecutive sweep points.
+        dtype: Data type of the setpoints, e.g. ``np.float32`` for
+            instruments that take single precision values.
+        endpoint: If False, ``10**stop`` is not included in the setpoints, as
+            for ``np.logspace``.
     """
 
     def __init__(
@@ -130,36 +171,78 @@ class LogSweep(AbstractSweep[np.float64]):
         num_points: int,
         delay: float = 0,
         post_actions: ActionsT = (),
+        dtype: npt.DTypeLike = np.float64,
+        endpoint: bool = True,
     ):
-        self._param = param
+        self.param = param
         self._start = start
         self._stop = stop
-        self._num_points = num_points
-        self._delay = delay
-        self._post_actions = post_actions
-
-    def get_setpoints(self) -> npt.NDArray[np.float64]:
+        self._dtype = np.dtype(dtype)
+        self._endpoint = endpoint
+        self.delay = delay
+        self.post_actions = post_actions
+        exponents = _linspace(start, stop, num_points, endpoint)
+        self._setpoints = np.power(10.0, exponents, out=exponents).astype(
+            self._dtype, copy=False
+        )
+        self._setpoints.setflags(write=False)
+        self.num_points = self._setpoints.shape[0]
+
+    def get_setpoints(self) -> npt.NDArray[np.floating[Any]]:
         """
         Logarithmically spaced numpy array for supplied start, stop and
-        num_points.
+        num_points. The returned array is read-only.
         """
-        return np.logspace(self._start, self._stop, self._num_points)
+        return self._setpoints
 
-    @property
-    def param(self) -> ParameterBase:
-        return self._param
 
-    @property
-    def delay(self) -> float:
-        return self._delay
+class GeomSweep(AbstractSweep[np.floating[Any]]):
+    """
+    Geometric sweep. Unlike ``LogSweep``, start and stop are the actual
+    first and last setpoints rather than their base 10 exponents.
 
-    @property
-    def num_points(self) -> int:
-        return self._num_points
+    Args:
+        param: Qcodes parameter for sweep.
+        start: Sweep start value.
+        stop: Sweep end value.
+        num_points: Number of sweep points.
+        delay: Time in seconds between two consecutive sweep points.
+        dtype: Data type of the setpoints, e.g. ``np.float32`` for
+            instruments that take single precision values.
+        endpoint: If False, ``stop`` is not included in the setpoints, as
+            for ``np.geomspace``.
+    """
 
-    @property
-    def post_actions(self) -> ActionsT:
-        return self._post_actions
+    def __init__(
+        self,
+        param: ParameterBase,
+        start: float,
+        stop: float,
+        num_points: int,
+        delay: float = 0,
+        post_actions: ActionsT = (),
+        dtype: npt.DTypeLike = np.float64,
+        endpoint: bool = True,
+    ):
+        self.param = param
+        self._start = start
+        self._stop = stop
+        self._dtype = np.dtype(dtype)
+        self._endpoint = endpoint
+        self.delay = delay
+        self.post_actions = post_actions
+        self._setpoints = np.geomspace(
+            start, stop, num_points, endpoint=endpoint, dtype=self._dtype
+        )
+        self._setpoints.setflags(write=False)
+        self.num_points = self._setpoints.shape[0]
+
+    def get_setpoints(self) -> npt.NDArray[np.floating[Any]]:
+        """
+        Geometrically spaced numpy array for supplied start, stop and
+        num_points. The returned array is read-only.
+        """
+        return self._setpoints
 
 
 class ArraySweep(AbstractSweep, Generic[T]):
@@ -171,6 +254,13 @@ class ArraySweep(AbstractSweep, Generic[T]):
         array: array with values to sweep.
         delay: Time in seconds between two consecutive sweep points.
         post_actions: Actions to do after each sweep point.
+        dtype: Data type of the setpoints. By default it is inferred from
+            ``array``.
+
+    Raises:
+        TypeError: If the values in ``array`` can only be represented by an
+            array of Python objects.
+        ValueError: If ``array`` is not one dimensional.
     """
 
     def __init__(
@@ -179,27 +269,28 @@ class ArraySweep(AbstractSweep, Generic[T]):
         array: Sequence[Any] | npt.NDArray[T],
         delay: float = 0,
         post_actions: ActionsT = (),
+        dtype: npt.DTypeLike | None = None,
     ):
-        self._param = param
-        self._array = np.array(array)
-        self._delay = delay
-        self._post_actions = post_actions
+        self.param = param
+        # a view so that the caller's array does not become read-only
+        self._array = np.asarray(array, dtype=dtype).view()
+        if self._array.dtype == np.dtype(object):
+            raise TypeError(
+                "ArraySweep cannot sweep values that can only be stored in "
+                "an array with dtype object."
+            )
+        if self._array.ndim != 1:
+            raise ValueError(
+                f"ArraySweep requires a one dimensional array of setpoints, "
+                f"got an array with {self._array.ndim} dimensions."
+            )
+        self._array.setflags(write=False)
+        self.num_points = self._array.shape[0]
+        self.delay = delay
+        self.post_actions = post_actions
 
     def get_setpoints(self) -> npt.NDArray[T]:
+        """
+        Read-only view of the array supplied at construction.
+        """
         return self._array
-
-    @property
-    def param(self) -> ParameterBase:
-        return self._param
-
-    @property
-    def delay(self) -> float:
-        return self._delay
-
-    @property
-    def num_points(self) -> int:
-        return len(self._array)
-
-    @property
-    def post_actions(self) -> ActionsT:
-        return self._post_actions
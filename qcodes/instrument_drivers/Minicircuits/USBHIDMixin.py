@@ -3,8 +3,8 @@ A mixin module for USB Human Interface Device instruments
 """
 import os
 import struct
-import time
-from typing import Any, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Sequence
 
 try:
     import pywinusb.hid as hid
@@ -15,6 +15,18 @@ except ImportError:
 
 from qcodes.instrument.base import Instrument
 
+# Evaluated once at import time; raised by `USBHIDMixin._check_hid_import`.
+_HID_IMPORT_ERROR: Optional[str]
+if os.name != 'nt':
+    _HID_IMPORT_ERROR = "This driver only works on Windows."
+elif hid is None:
+    _HID_IMPORT_ERROR = (
+        "pywinusb is not installed. Please install it by typing "
+        "'pip install pywinusb' in a qcodes environment terminal"
+    )
+else:
+    _HID_IMPORT_ERROR = None
+
 
 class USBHIDMixin(Instrument):
     """
@@ -31,14 +43,8 @@ class USBHIDMixin(Instrument):
 
     @staticmethod
     def _check_hid_import() -> None:
-        if os.name != 'nt':
-            raise ImportError("This driver only works on Windows.")
-
-        if hid is None:
-            raise ImportError(
-                "pywinusb is not installed. Please install it by typing "
-                "'pip install pywinusb' in a qcodes environment terminal"
-            )
+        if _HID_IMPORT_ERROR is not None:
+            raise ImportError(_HID_IMPORT_ERROR)
 
     def __init__(self, name: str, instance_id: Optional[str] = None,
                  timeout: float = 2,
@@ -61,15 +67,16 @@ class USBHIDMixin(Instrument):
         self._device.open()
 
         self._data_buffer: Optional[bytes] = None
+        self._reply_event = threading.Event()
         self._device.set_raw_data_handler(self._handler)
 
         self._timeout = timeout
-        self._tries_per_second = 5
 
         super().__init__(name, **kwargs)
 
     def _handler(self, data: bytes) -> None:
         self._data_buffer = data
+        self._reply_event.set()
 
     def _get_data_buffer(self) -> Optional[bytes]:
         data = self._data_buffer
@@ -95,11 +102,34 @@ class USBHIDMixin(Instrument):
         """
         data = self._pack_string(cmd)
 
+        self._reply_event.clear()
         result = self._device.send_output_report(data)
         if not result:
             raise RuntimeError(f"Communication with device failed for command "
                                f"{cmd}")
 
+    def write_raw_batch(self, cmds: Sequence[str]) -> None:
+        """
+        Send several string commands to the human interface device in a row
+
+        Each command still goes out as its own output report, because the
+        device expects one command per report, but the lookups done by
+        `write_raw` are only done once for the whole batch. Sending stops at
+        the first command that fails.
+
+        Args:
+            cmds: the commands to send in a form of strings
+        """
+        pack_string = self._pack_string
+        send_output_report = self._device.send_output_report
+
+        self._reply_event.clear()
+        for cmd in cmds:
+            self.log.debug(f"Writing: {cmd}")
+            if not send_output_report(pack_string(cmd)):
+                raise RuntimeError(f"Communication with device failed for "
+                                   f"command {cmd}")
+
     def ask_raw(self, cmd: str) -> str:
         """
         Send a string command to the human interface device and wait for a reply
@@ -117,14 +147,10 @@ class USBHIDMixin(Instrument):
         """
         self.write_raw(cmd)
 
-        number_of_tries = int(self._tries_per_second * self._timeout)
-
+        # the event is set by `_handler` as soon as the device replies
         response = None
-        for _ in range(number_of_tries):
-            time.sleep(1 / self._tries_per_second)
+        if self._reply_event.wait(self._timeout):
             response = self._get_data_buffer()
-            if response is not None:
-                break
 
         if response is None:
             raise TimeoutError(f"Timed out for command {cmd}")
@@ -133,6 +159,7 @@ class USBHIDMixin(Instrument):
 
     def close(self) -> None:
         self._device.close()
+        super().close()
 
     @classmethod
     def enumerate_devices(cls) -> List[str]:
@@ -143,7 +170,7 @@ class USBHIDMixin(Instrument):
         cls._check_hid_import()
 
         devs = hid.HidDeviceFilter(
-            porduct_id=cls.product_id,
+            product_id=cls.product_id,
             vendor_id=cls.vendor_id
         ).get_devices()
 
@@ -175,6 +202,12 @@ class MiniCircuitsHIDMixin(USBHIDMixin):
         self._usb_endpoint = 0
         self._end_of_message = b"\x00"
         self.packet_size = 64
+        # `struct.Struct` objects for packing, keyed by the command length
+        self._packers: Dict[int, struct.Struct] = {}
+        # endpoint byte, interrupt code and reply data
+        self._reply_size = self.packet_size + 1
+        # reused output report: endpoint byte followed by one packet
+        self._tx_buffer = bytearray(self.packet_size + 1)
 
         super().__init__(name, instance_id, timeout, **kwargs)
 
@@ -182,6 +215,9 @@ class MiniCircuitsHIDMixin(USBHIDMixin):
         """
         Pack a string to a binary format such that it can be sent to the HID.
 
+        The packet is written into a buffer that is reused by the next call,
+        so the result must be sent before packing another command.
+
         Args:
             cmd: a SCPI command to send
         """
@@ -196,14 +232,20 @@ class MiniCircuitsHIDMixin(USBHIDMixin):
         if pad_len < 0:
             raise ValueError(f"Length of data exceeds {self.packet_size} B")
 
-        packed_data = struct.pack(
-            f"BB{str_len}s{pad_len}x",
+        packer = self._packers.get(str_len)
+        if packer is None:
+            packer = struct.Struct(f"BB{str_len}s{pad_len}x")
+            self._packers[str_len] = packer
+
+        packer.pack_into(
+            self._tx_buffer,
+            0,
             self._usb_endpoint,
             self._sending_scpi_cmds_code,
             cmd.encode("ascii")
         )
 
-        return packed_data
+        return self._tx_buffer
 
     def _unpack_string(self, response: bytes) ->str:
         """
@@ -214,9 +256,14 @@ class MiniCircuitsHIDMixin(USBHIDMixin):
         Args:
             response: a raw byte sequence response from the instrument
         """
-        _, _, reply_data = struct.unpack(
-            f"BB{self.packet_size - 1}s",
-            bytes(response)
-        )
-        span = reply_data.find(self._end_of_message)
-        return reply_data[:span].decode("ascii")
+        # pywinusb hands over the report as a sequence of ints, so a single
+        # conversion to bytes is needed; the reply data is then decoded
+        # through a memoryview instead of being sliced into a new object
+        raw_response = bytes(response)
+        if len(raw_response) != self._reply_size:
+            raise ValueError(
+                f"Expected a response of {self._reply_size} B, got "
+                f"{len(raw_response)} B"
+            )
+        span = raw_response.find(self._end_of_message, 2)
+        return str(memoryview(raw_response)[2:span], "ascii")
@@ -8,8 +8,9 @@ import time
 from collections import namedtuple
 from enum import Enum
 from functools import partial
-from typing import Any, Dict, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pyvisa as visa
 from pyvisa.resources.serial import SerialInstrument
 
@@ -29,11 +30,17 @@ class Mode(Enum):
     defining the combined voltage and current range.
 
     get_label() returns a text representation of the mode.
+    The voltage and current range integers are available as the
+    ``vrange`` and ``irange`` attributes of each member.
     """
     vhigh_ihigh = _ModeTuple(v=0, i=1)
     vhigh_ilow = _ModeTuple(v=0, i=0)
     vlow_ilow = _ModeTuple(v=1, i=0)
 
+    def __init__(self, v: int, i: int) -> None:
+        self.vrange = v
+        self.irange = i
+
     def get_label(self) -> str:
         _MODE_LABELS = {
                 "vhigh_ihigh": "V range high / I range high",
@@ -42,6 +49,43 @@ class Mode(Enum):
         return _MODE_LABELS[self.name]
 
 
+# Translation of the 'status' reply of the QDAC
+_IRANGE_TRANS = {'hi cur': 1, 'lo cur': 0}
+_VRANGE_TRANS = {'X 1': 0, 'X 0.1': 1}
+_MODE_BY_RANGES = {(mode.vrange, mode.irange): mode for mode in Mode}
+
+# Connect a channel to a generator and program the generator waveform
+_WAV_TMPL = 'wav {} {} {} {}'
+_FUN_TMPL = 'fun {} {} {} {} {} {}'
+
+
+def _parse_wav(response: str) -> Tuple[int, float, float]:
+    # Reply of 'wav <chan>': generator, amplitude, offset
+    fg, amplitude, offset = response.split(',')
+    return int(fg), float(amplitude), float(offset)
+
+
+def _parse_minmax(response: str) -> Dict[str, float]:
+    # Reply of 'rang <chan> <vrange>': 'MIN: <min> MAX: <max>'
+    return {'Min': float(response.split('MIN:')[1].split('MAX')[0].strip()),
+            'Max': float(response.split('MAX:')[1].strip())}
+
+
+def _parse_syn(response: str) -> Tuple[int, float, float]:
+    # Reply of 'syn <port>': generator, delay (ms), duration (ms)
+    fg, delay_ms, duration_ms = response.split(',')
+    return int(fg), float(delay_ms), float(duration_ms)
+
+
+def _sets_directly(parameter: Any) -> bool:
+    # True if setting the parameter only validates and calls set_raw, i.e.
+    # no stepping, delays or value transformation are configured
+    return (parameter.step is None and parameter.inter_delay == 0
+            and parameter.post_delay == 0 and parameter.scale is None
+            and parameter.offset is None and parameter.set_parser is None
+            and parameter.val_mapping is None)
+
+
 class Waveform:
     # Enum-like class defining the built-in waveform types
     sine = 1
@@ -76,6 +120,9 @@ class QDacChannel(InstrumentChannel):
             channum: The number of the channel (1-24 or 1-48)
         """
         super().__init__(parent, name)
+        self._channum = channum
+        # Start of the command setting a DC voltage, see QDac._set_voltage
+        self._set_dc_prefix = f'wav {channum} 0 0 0;set {channum} '
 
         # Add the parameters
         self.add_parameter(name='v',
@@ -142,12 +189,13 @@ class QDacChannel(InstrumentChannel):
             params_to_skip_update: Optional[Sequence[str]] = None
     ) -> Dict[Any, Any]:
         update_currents = self._parent._update_currents and update
-        if update and not self._parent._get_status_performed:
+        if update and not self._parent._status_is_recent(
+                currents=update_currents):
             self._parent._update_cache(update_currents=update_currents)
         # call update_cache rather than getting the status individually for
-        # each parameter. This is only done if _get_status_performed is False
-        # this is used to signal that the parent has already called it and
-        # no need to repeat.
+        # each parameter. This is skipped if the status (and the currents,
+        # if they are to be updated) has just been read, e.g. by the parent
+        # snapshot, and nothing has been written since.
         if params_to_skip_update is None:
             params_to_skip_update = ('v', 'i', 'mode')
         snap = super().snapshot_base(
@@ -174,18 +222,41 @@ class QDacMultiChannelParameter(MultiChannelInstrumentParameter):
         """
         # For voltages, we can do something slightly faster than the naive
         # approach by asking the instrument for a channel overview.
+        # Currents are queried for all channels in compound messages.
 
         if self._param_name == 'v':
             qdac = self._channels[0]._parent
             qdac._update_cache(update_currents=False)
             output = tuple(chan.parameters[self._param_name].cache()
                            for chan in self._channels)
+        elif self._param_name == 'i':
+            qdac = self._channels[0]._parent
+            responses = qdac._ask_many(
+                [f'get {chan._channum}' for chan in self._channels])
+            output = tuple(qdac._current_parser(response)
+                           for response in responses)
+            for chan, current in zip(self._channels, output):
+                chan.parameters['i'].cache.set(current)
         else:
             output = tuple(chan.parameters[self._param_name].get()
                            for chan in self._channels)
 
         return output
 
+    def set_raw(self, value: ParamRawDataType) -> None:
+        """
+        Set all parameters to this value. Voltages are set in compound
+        messages rather than one message per channel, unless a channel
+        voltage is stepped, delayed or transformed when set.
+        """
+        if (self._param_name == 'v'
+                and all(_sets_directly(chan.v) for chan in self._channels)):
+            qdac = self._channels[0]._parent
+            qdac._multi_set_voltage([chan._channum for chan in self._channels],
+                                    [value]*len(self._channels))
+        else:
+            super().set_raw(value)
+
 
 class QDac(VisaInstrument):
     """
@@ -207,6 +278,11 @@ class QDac(VisaInstrument):
     # set nonzero value (seconds) to accept older status when reading settings
     max_status_age = 1
 
+    # Maximum number of commands concatenated by `;` in a single write. A
+    # ramp of 8 channels on a 48 channel QDAC programs up to 22 commands
+    # (5 x syn + 8 x (wav + fun) + trig)
+    max_cmds_per_write = 22
+
     def __init__(self,
                  name: str,
                  address: str,
@@ -228,7 +304,10 @@ class QDac(VisaInstrument):
 
         super().__init__(name, address, **kwargs)
         handle = self.visa_handle
-        self._get_status_performed = False
+        # time.monotonic() of the last status and current reads, reset by
+        # every write
+        self._last_status_time = 0.0
+        self._last_currents_time = 0.0
 
         assert isinstance(handle, SerialInstrument)
         # Communication setup + firmware check
@@ -238,6 +317,14 @@ class QDac(VisaInstrument):
         self.set_terminator('\n')
         handle.write_termination = '\n'
         self._write_response = ''
+        # Filled in by _get_firmware_version and _get_number_of_channels
+        self._fw_version: Optional[float] = None
+        self._fw_version_reply = ''
+        self._num_channels: Optional[int] = None
+        # Calibrated output limits, {chan: {vrange: {'Min': , 'Max': }}}
+        self.vranges: Dict[int, Dict[int, Dict[str, float]]] = {}
+        # Verbose mode of the instrument, None until set by _set_verbose
+        self._verbose: Optional[bool] = None
         firmware_version = self._get_firmware_version()
         if firmware_version < 1.07:
             LOG.warning(f"Firmware version: {firmware_version}")
@@ -279,7 +366,7 @@ class QDac(VisaInstrument):
                                    label=label,
                                    unit='C',
                                    get_cmd=f'tem {board} {sensor}',
-                                   get_parser=self._num_verbose)
+                                   get_parser=float)
 
         self.add_parameter(name='cal',
                            set_cmd='cal {}',
@@ -293,11 +380,10 @@ class QDac(VisaInstrument):
 
         # Due to a firmware bug in 1.07 voltage ranges are always reported
         # vebosely. So for future compatibility we set verbose True
-        self.write('ver 1')
+        self._set_verbose(True)
         self._update_voltage_ranges()
         # The driver require verbose mode off except for the above command
-        self.write('ver 0')
-        self._verbose = False  # Just so that the code can check the state
+        self._set_verbose(False)
         self.connect_message()
         LOG.info('[*] Querying all channels for voltages and currents...')
         self._update_cache(update_currents=update_currents)
@@ -315,10 +401,12 @@ class QDac(VisaInstrument):
         # Function generators and triggers (used in ramping)
         self._fgs = set(range(1, 9))
         self._assigned_fgs: Dict[int, Generator] = {}  # {chan: fg}
+        self._free_fgs = set(self._fgs)  # Not assigned to any channel
         self._trigs = set(range(1, 10))
         self._assigned_triggers: Dict[int, int] = {}  # {fg: trigger}
         # Sync channels
         self._syncoutputs: Dict[int, int] = {}  # {chan: syncoutput}
+        self._sync_to_chan: Dict[int, int] = {}  # {syncoutput: chan}
 
     def _load_state(self) -> None:
         """
@@ -332,88 +420,126 @@ class QDac(VisaInstrument):
         # Assumes that all variables and virtual
         # parameters have been initialised (and read)
 
-        self.write('ver 0')  # Just to be on the safe side
+        self._set_verbose(False)  # Just to be on the safe side
 
         self._reset_bookkeeping()
-        for ch_idx in range(self.num_chans):
-            chan = ch_idx + 1
-            # Check if the channels are being ramped
-            # It is not possible to find out if it has a slope assigned
-            # as it may be ramped explicitely by the user
-            # We assume that generators are running, but we cannot know
-            self.write(f'wav {chan}')
-            fg_str, amplitude_str, offset_str = self._write_response.split(',')
-            amplitude = float(amplitude_str)
-            offset = float(offset_str)
-            fg = int(fg_str)
-            if fg in range(1, 9):
-                voltage = self.channels[ch_idx].v.get()
-                time_now = time.time()
-                self.write(f'fun {fg}')
-                response = self._write_response.split(',')
-                waveform = int(response[0])
-                # Probably this driver is involved if a stair case is assigned
-                if waveform == Waveform.staircase:
-                    if len(response) == 6:
-                        step_length_ms, no_steps, rep, rep_remain_str, trigger \
-                            = response[1:6]
-                        rep_remain = int(rep_remain_str)
-                    else:
-                        step_length_ms, no_steps, rep, trigger = response[1:5]
-                        rep_remain = int(rep)
-                    ramp_time = 0.001 * float(step_length_ms) * int(no_steps)
-                    ramp_remain = 0
-                    if (amplitude != 0):
-                        ramp_remain = (amplitude+offset-voltage)/amplitude
-                    if int(rep) == -1:
-                        time_end = time_now + 315360000
-                    else:
-                        time_end = (ramp_remain + max(0, rep_remain-1)) \
-                                   * ramp_time + time_now + 0.001
+        # Check if the channels are being ramped
+        # It is not possible to find out if it has a slope assigned
+        # as it may be ramped explicitely by the user
+        # We assume that generators are running, but we cannot know
+        # All queries are sent as compound messages, one per kind of query
+        generators: Dict[int, Tuple[int, float, float]] = {}
+        wav_responses = self._ask_many(
+            [f'wav {chan}' for chan in self._chan_range])
+        for chan, wav_response in zip(self._chan_range, wav_responses):
+            wav = _parse_wav(wav_response)
+            if wav[0] in range(1, 9):
+                generators[chan] = wav
+        if not generators:
+            return
+
+        voltages = self._get_voltages(list(generators))
+        fgs = sorted({fg for fg, _, _ in generators.values()})
+        fun_responses = {
+            fg: response.split(',') for fg, response in
+            zip(fgs, self._ask_many([f'fun {fg}' for fg in fgs]))}
+        syns = [_parse_syn(response) for response in self._ask_many(
+            [f'syn {syn}' for syn in range(1, self._num_syns+1)])]
+        time_now = time.time()
+
+        channels = self.channels
+        for chan, voltage in zip(generators, voltages):
+            channel = channels[chan-1]
+            fg, amplitude, offset = generators[chan]
+            response = fun_responses[fg]
+            waveform = int(response[0])
+            # Probably this driver is involved if a stair case is assigned
+            if waveform == Waveform.staircase:
+                if len(response) == 6:
+                    step_length_ms, no_steps, rep, rep_remain_str, trigger \
+                        = response[1:6]
+                    rep_remain = int(rep_remain_str)
+                else:
+                    step_length_ms, no_steps, rep, trigger = response[1:5]
+                    rep_remain = int(rep)
+                ramp_time = 0.001 * float(step_length_ms) * int(no_steps)
+                ramp_remain = 0
+                if (amplitude != 0):
+                    ramp_remain = (amplitude+offset-voltage)/amplitude
+                if int(rep) == -1:
+                    time_end = time_now + 315360000
+                else:
+                    time_end = (ramp_remain + max(0, rep_remain-1)) \
+                               * ramp_time + time_now + 0.001
+            else:
+                if waveform == Waveform.sine:
+                    period_ms, rep, rep_remain_str, trigger = response[1:5]
                 else:
-                    if waveform == Waveform.sine:
-                        period_ms, rep, rep_remain_str, trigger = response[1:5]
-                    else:
-                        period_ms, _, rep, rep_remain_str, trigger = response[1:6]
-                    if int(rep) == -1:
-                        time_end = time_now + 315360000  # 10 years from now
-                    else:  # +1 is just a safe guard
-                        time_end = time_now + 0.001 \
-                                   * (int(rep_remain_str)+1) * float(period_ms)
+                    period_ms, _, rep, rep_remain_str, trigger = response[1:6]
+                if int(rep) == -1:
+                    time_end = time_now + 315360000  # 10 years from now
+                else:  # +1 is just a safe guard
+                    time_end = time_now + 0.001 \
+                               * (int(rep_remain_str)+1) * float(period_ms)
 
-                self._assigned_fgs[chan] = Generator(fg)
-                self._assigned_fgs[chan].t_end = time_end
-                if int(trigger) != 0:
-                    self._assigned_triggers[fg] = int(trigger)
-                for syn in range(1, self._num_syns+1):
-                    self.write(f'syn {syn}')
-                    syn_fg, delay_ms, duration_ms = \
-                        self._write_response.split(',')
-                    if int(syn_fg) == fg:
-                        self.channels[ch_idx].sync.cache.set(syn)
-                        self.channels[ch_idx].sync_delay(float(delay_ms)/1000)
-                        self.channels[ch_idx].sync_duration(
-                            float(duration_ms)/1000)
+            self._assigned_fgs[chan] = Generator(fg)
+            self._assigned_fgs[chan].t_end = time_end
+            self._free_fgs.discard(fg)
+            if int(trigger) != 0:
+                self._assigned_triggers[fg] = int(trigger)
+            for syn, (syn_fg, delay_ms, duration_ms) in enumerate(syns,
+                                                                 start=1):
+                if syn_fg == fg:
+                    channel.sync.cache.set(syn)
+                    channel.sync_delay(delay_ms/1000)
+                    channel.sync_duration(duration_ms/1000)
 
     def reset(self, update_currents: bool = False) -> None:
         """
         Resets the instrument setting all channels to zero output voltage
         and all parameters to their default values, including removing any
         assigned sync putputs, function generators, triggers etc.
+
+        Channels are set to zero directly, except for channels whose voltage
+        parameter has a step, delay or value transformation configured.
+        These are set to zero through the parameter, so they are stepped
+        down like with ``v(0)``.
         """
         # In case the QDAC has been switched off/on
         # clear the io buffer and set verbose False
         self.device_clear()
-        self.write('ver 0')
+        self._verbose = None
+        self._set_verbose(False)
 
         self.cal(0)
-        # Resetting all slopes first will cause v.set() disconnect generators
-        self.channels[0:self.num_chans].slope('Inf')
-        self.channels[0:self.num_chans].v(0)
-        self.channels[0:self.num_chans].mode(Mode.vhigh_ihigh)
-        self.channels[0:self.num_chans].sync(0)
-        self.channels[0:self.num_chans].sync_delay(0)
-        self.channels[0:self.num_chans].sync_duration(0.01)
+        # Disconnect the generators, zero the outputs and then switch to the
+        # default mode. The commands are written in as few compound messages
+        # as possible, and the channel parameters are only updated in cache
+        default_mode = Mode.vhigh_ihigh
+        cmds = []
+        for chan, channel in zip(self._chan_range, self.channels):
+            if _sets_directly(channel.v):
+                cmds.append(f'wav {chan} 0 0 0')
+                cmds.append(f'set {chan} 0')
+            else:
+                # Resetting the slope first makes v.set() step in DC mode
+                channel.slope('Inf')
+                channel.v(0)
+            # Voltage relay before current relay, see _set_mode
+            cmds.append(f'vol {chan} {default_mode.vrange}')
+            cmds.append(f'cur {chan} {default_mode.irange}')
+        cmds.extend(f'syn {syn} 0 0 0' for syn in range(1, self._num_syns+1))
+        self._write_many(cmds)
+
+        v_vals = self._v_vals
+        for chan, channel in enumerate(self.channels, start=1):
+            channel.slope.cache.set('Inf')
+            channel.v.cache.set(0)
+            channel.v.vals = v_vals(chan, default_mode.vrange)
+            channel.mode.cache.set(default_mode)
+            channel.sync.cache.set(0)
+            channel.sync_delay.cache.set(0)
+            channel.sync_duration.cache.set(0.01)
 
         if update_currents:
             self.channels[0:self.num_chans].i.get()
@@ -428,16 +554,12 @@ class QDac(VisaInstrument):
         update_currents = self._update_currents and update is True
         if update:
             self._update_cache(update_currents=update_currents)
-            self._get_status_performed = True
         # call _update_cache rather than getting the status individually for
-        # each parameter. We set _get_status_performed to True
-        # to indicate that each update channel does not need to call this
-        # function as opposed to when snapshot is called on an individual
-        # channel
+        # each parameter. The channel snapshots find the status recent and
+        # do not read it again
         snap = super().snapshot_base(
                                 update=update,
                                 params_to_skip_update=params_to_skip_update)
-        self._get_status_performed = False
         return snap
 
     #########################
@@ -466,8 +588,78 @@ class QDac(VisaInstrument):
             # SYNCing happens inside ramp_voltages
             self.ramp_voltages([chan], [v_start], [v_set], duration)
         else:  # Should not be necessary to wav here.
-            self.write('wav {ch} 0 0 0;set {ch} {voltage:.6f}'
-                       .format(ch=chan, voltage=v_set))
+            self.write(self.channels[chan-1]._set_dc_prefix
+                       + format(v_set, '.6f'))
+
+    def _validate_voltages(self, chans: Sequence[int],
+                           voltages: Sequence[float]) -> None:
+        """
+        Validate voltages for several channels, comparing them all at once
+        with the limits of the v validators. If a voltage is out of bounds
+        (or not a plain number) the v parameter of its channel validates it
+        and raises the error.
+
+        Args:
+            chans: The 1-indexed channel numbers
+            voltages: The voltage of each channel
+        """
+        channels = self.channels
+        validators = [channels[chan-1].v.vals for chan in chans]
+        values = np.asarray(voltages)
+        if (values.dtype.kind in 'iuf' and values.shape == (len(chans),)
+                and all(isinstance(validator, vals.Numbers)
+                        for validator in validators)):
+            limits = np.array([(validator.min_value, validator.max_value)
+                               for validator in validators]).reshape(-1, 2)
+            if ((limits[:, 0] <= values) & (values <= limits[:, 1])).all():
+                return
+        for chan, voltage in zip(chans, voltages):
+            channels[chan-1].v.validate(voltage)
+
+    def _get_voltages(self, chans: Sequence[int]) -> List[float]:
+        """
+        Get the voltage of several channels in compound queries, updating
+        the cache of their v parameters.
+
+        Args:
+            chans: The 1-indexed channel numbers
+        """
+        voltages = [float(response) for response in
+                    self._ask_many([f'set {chan}' for chan in chans])]
+        channels = self.channels
+        for chan, voltage in zip(chans, voltages):
+            channels[chan-1].v.cache.set(voltage)
+        return voltages
+
+    def _multi_set_voltage(self, chans: Sequence[int],
+                           v_sets: Sequence[float]) -> None:
+        """
+        Set the voltage of several channels.
+
+        Args:
+            chans: The 1-indexed channel numbers
+            v_sets: The target voltage of each channel
+
+        Channels with a slope assigned, or with a v parameter that steps,
+        delays or transforms the value, are set through their v parameter.
+        The others are validated and then set in compound messages.
+        """
+        channels = self.channels
+        slopes = self._slopes
+        dc_channels = []
+        cmds = []
+        for chan, v_set in zip(chans, v_sets):
+            channel = channels[chan-1]
+            if slopes.get(chan, None) or not _sets_directly(channel.v):
+                channel.v.set(v_set)
+            else:
+                channel.v.validate(v_set)
+                dc_channels.append((channel, v_set))
+                cmds.append(f'wav {chan} 0 0 0')
+                cmds.append(f'set {chan} {v_set:.6f}')
+        self._write_many(cmds)
+        for channel, v_set in dc_channels:
+            channel.v.cache.set(v_set)
 
     def _set_mode(self, chan: int, new_mode: Mode) -> None:
         """
@@ -491,8 +683,7 @@ class QDac(VisaInstrument):
         # a generator, so we need to ask.
         def wav_or_set_msg(chan: int, new_voltage: float) -> str:
             self.write(f'wav {chan}')
-            fw_str = self._write_response
-            gen, _, _ = fw_str.split(',')
+            gen = self._write_response.partition(',')[0]
             if int(gen) > 0:
                 # The amplitude must be set to zero to avoid potential overflow
                 # Assuming that voltage range is not changed during a ramp
@@ -502,11 +693,11 @@ class QDac(VisaInstrument):
                 return f'set {chan} {new_voltage:.6f}'
 
         old_mode = self.channels[chan-1].mode.cache()
-        new_vrange = new_mode.value.v
-        old_vrange = old_mode.value.v
-        new_irange = new_mode.value.i
-        old_irange = old_mode.value.i
-        message = ''
+        new_vrange = new_mode.vrange
+        old_vrange = old_mode.vrange
+        new_irange = new_mode.irange
+        old_irange = old_mode.irange
+        parts = []
         max_zero_voltage = {0: 20e-6, 1: 3e-6}
         NON_ZERO_VOLTAGE_MSG = (
                 'Please set the voltage to zero before changing the voltage'
@@ -524,36 +715,40 @@ class QDac(VisaInstrument):
 
         if (new_irange != old_irange) and (new_vrange == old_vrange == 0):
             # Only the current sensor relay has to switch:
-            message += f'cur {chan} {new_irange}'
+            parts.append(f'cur {chan} {new_irange}')
         # The voltage relay (also) has to switch:
         else:
             # Current sensor relay on->off before voltage relay off->on:
             if new_irange < old_irange and new_vrange > old_vrange:
-                message += f'cur {chan} {new_irange};'
+                parts.append(f'cur {chan} {new_irange}')
             old_voltage = self.channels[chan-1].v.get()
             # Check if voltage is non-zero and mode_force is off
             if ((self.mode_force() is False) and
                     (abs(old_voltage) > max_zero_voltage[old_vrange])):
                 raise ValueError(NON_ZERO_VOLTAGE_MSG)
             new_voltage = _clipto(
-                    old_voltage, self.vranges[chan][new_vrange]['Min'],
-                    self.vranges[chan][new_vrange]['Max'])
-            message += f'vol {chan} {new_vrange};'
-            message += wav_or_set_msg(chan, new_voltage)
+                    old_voltage,
+                    *self._vranges_arr[chan-1, new_vrange].tolist())
+            parts.append(f'vol {chan} {new_vrange}')
+            parts.append(wav_or_set_msg(chan, new_voltage))
             # Current sensor relay off->on after voltage relay on->off:
             if new_irange > old_irange and new_vrange < old_vrange:
-                message += f';cur {chan} {new_irange}'
+                parts.append(f'cur {chan} {new_irange}')
             self.channels[chan-1].v.vals = self._v_vals(chan, new_vrange)
             self.channels[chan-1].v.cache.set(new_voltage)
 
-        self.write(message)
+        self.write(';'.join(parts))
 
     def _v_vals(self, chan: int, vrange_int: int) -> vals.Numbers:
         """
         Returns the validator for the specified voltage range.
         """
-        return vals.Numbers(self.vranges[chan][vrange_int]['Min'],
-                            self.vranges[chan][vrange_int]['Max'])
+        validator = self._v_vals_cache.get((chan, vrange_int))
+        if validator is None:
+            min_, max_ = self._vranges_arr[chan-1, vrange_int].tolist()
+            validator = vals.Numbers(min_, max_)
+            self._v_vals_cache[(chan, vrange_int)] = validator
+        return validator
 
     def _update_v_validators(self) -> None:
         """
@@ -561,30 +756,21 @@ class QDac(VisaInstrument):
         actual calibrated output limits for the range each individual channel
         is currently in.
         """
-        for chan in range(1, self.num_chans+1):
-            vrange = self.channels[chan-1].mode.value.v
-            self.channels[chan-1].v.vals = self._v_vals(chan, vrange)
-
-    def _num_verbose(self, s: str) -> float:
-        """
-        Turns a return value from the QDac into a number.
-        If the QDac is in verbose mode, this involves stripping off the
-        value descriptor.
-        """
-        if self._verbose:
-            s = s.split(': ')[-1]
-        return float(s)
+        v_vals = self._v_vals
+        for chan, channel in enumerate(self.channels, start=1):
+            channel.v.vals = v_vals(chan, channel.mode.cache().vrange)
 
     def _current_parser(self, s: str) -> float:
         """
         Parser for chXX_i parameter (converts from uA to A)
         """
-        return 1e-6*self._num_verbose(s)
+        return 1e-6*float(s)
 
     def _update_cache(self, update_currents: bool = False) -> None:
         """
         Function to query the instrument and get the status of all channels.
-        Takes a while to finish.
+        Takes a while to finish. A status read less than `max_status_age`
+        seconds ago is reused if nothing has been written since.
 
         The `status` call generates 27 or 51 lines of output. Send the command
         and read the first one, which is the software version line
@@ -597,8 +783,10 @@ class QDac(VisaInstrument):
         ... (all 24/48 channels like this)
         (no termination afterward besides the \n ending the last channel)
         """
-        irange_trans = {'hi cur': 1, 'lo cur': 0}
-        vrange_trans = {'X 1': 0, 'X 0.1': 1}
+        # Reuse the last status unless it is older than max_status_age, the
+        # instrument has been written to since or a generator may be running
+        if not update_currents and self._status_is_recent():
+            return
 
         # Status call, check the
         version_line = self.ask('status')
@@ -616,24 +804,58 @@ class QDac(VisaInstrument):
         if headers != expected_headers:
             raise ValueError('unrecognized header line: ' + header_line)
 
-        chans_left = set(self._chan_range)
+        # Rather than reading the channel lines one by one, read everything
+        # the instrument has sent so far in one go (waiting for at least one
+        # byte) and parse the complete lines of it
+        handle = self.visa_handle
+        channels = self.channels
+        v_vals = self._v_vals
+        unparsed = ''
+        chans_left = self.num_chans
         while chans_left:
-            line = self.read().strip()
-            if not line:
-                continue
-            chanstr, v, _, vrange, _, irange = line.split('\t')
-            chan = int(chanstr)
-            vrange_int = int(vrange_trans[vrange.strip()])
-            irange_int = int(irange_trans[irange.strip()])
-            mode = Mode((vrange_int, irange_int))
-            self.channels[chan-1].mode.cache.set(mode)
-            self.channels[chan-1].v.cache.set(float(v))
-            self.channels[chan-1].v.vals = self._v_vals(chan, vrange_int)
-            chans_left.remove(chan)
+            num_bytes = max(handle.bytes_in_buffer, 1)
+            unparsed += handle.read_bytes(num_bytes).decode(handle.encoding)
+            *lines, unparsed = unparsed.split('\n')
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                chanstr, v, _, vrange, _, irange = line.split('\t')
+                chan = int(chanstr)
+                vrange_int = _VRANGE_TRANS[vrange.strip()]
+                irange_int = _IRANGE_TRANS[irange.strip()]
+                channel = channels[chan-1]
+                channel.mode.cache.set(
+                    _MODE_BY_RANGES[(vrange_int, irange_int)])
+                channel.v.cache.set(float(v))
+                channel.v.vals = v_vals(chan, vrange_int)
+                chans_left -= 1
+        self._last_status_time = time.monotonic()
 
         if update_currents:
-            for chan in self._chan_range:
-                self.channels[chan-1].i.get()
+            for channel in channels:
+                channel.i.get()
+            self._last_currents_time = time.monotonic()
+
+    def _status_is_recent(self, currents: bool = False) -> bool:
+        """
+        Whether the status was read less than `max_status_age` seconds ago,
+        nothing has been written to the instrument since and no generator
+        may still be running.
+
+        Args:
+            currents: Also require the currents of all channels to have been
+                read by `_update_cache` within `max_status_age` seconds
+        """
+        time_mono = time.monotonic()
+        if time_mono - self._last_status_time >= self.max_status_age:
+            return False
+        if (currents and
+                time_mono - self._last_currents_time >= self.max_status_age):
+            return False
+        time_now = time.time()
+        return all(generator.t_end < time_now
+                   for generator in self._assigned_fgs.values())
 
     def _setsync(self, chan: int, sync: int) -> None:
         """
@@ -652,7 +874,7 @@ class QDac(VisaInstrument):
         if sync == 0:
             oldsync = self.channels[chan-1].sync.cache()
             # try to remove the sync from internal bookkeeping
-            self._syncoutputs.pop(chan, None)
+            self._sync_to_chan.pop(self._syncoutputs.pop(chan, 0), None)
             # free the previously assigned sync
             if oldsync is not None:
                 self.write(f'syn {oldsync} 0 0 0')
@@ -664,14 +886,14 @@ class QDac(VisaInstrument):
             oldsync = self.channels[chan-1].sync.cache()
             if sync != oldsync:
                 self.write(f'syn {oldsync} 0 0 0')
-        elif sync in self._syncoutputs.values():
+            del self._sync_to_chan[self._syncoutputs.pop(chan)]
+        if sync in self._sync_to_chan:
             # Assigning an already used SYNC port to a different channel
-            oldchan = [ch for ch, sy in self._syncoutputs.items()
-                       if sy == sync]
-            self._syncoutputs.pop(oldchan[0], None)
+            del self._syncoutputs[self._sync_to_chan.pop(sync)]
             self.write(f'syn {sync} 0 0 0')
 
         self._syncoutputs[chan] = sync
+        self._sync_to_chan[sync] = chan
         return
 
     def _getsync(self, chan: int) -> int:
@@ -742,7 +964,8 @@ class QDac(VisaInstrument):
         """
         Returns a dictionary of the calibrated Min and Max output
         voltages of 'channel' for the voltage given range (0,1) given by
-        'vrange_int'
+        'vrange_int'. The limits are only queried if they are not already
+        known from `vranges`, which `_update_voltage_ranges` refreshes.
         """
         # For firmware 1.07 verbose mode and nn verbose mode give verbose
         # result, So this is designed for verbose mode
@@ -752,21 +975,42 @@ class QDac(VisaInstrument):
         if vrange_int not in range(0, 2):
             raise ValueError('Range must be 0 or 1.')
 
+        known_vranges = self.vranges.get(channel)
+        if known_vranges is not None:
+            return dict(known_vranges[vrange_int])
         self.write(f'rang {channel} {vrange_int}')
-        fw_str = self._write_response
-        return {'Min': float(fw_str.split('MIN:')[1].split('MAX')[0].strip()),
-                'Max': float(fw_str.split('MAX:')[1].strip())}
+        return _parse_minmax(self._write_response)
 
     def _update_voltage_ranges(self) -> None:
         # Get all calibrated min/max output values, requires verbose on
         # in firmware version 1.07
-        self.write('ver 1')
+        self._set_verbose(True)
         self.vranges = {}
+        # Validators built by _v_vals from vranges, {(chan, vrange): vals}
+        self._v_vals_cache: Dict[Tuple[int, int], vals.Numbers] = {}
+        # Both ranges of all channels are queried in compound messages
+        responses = iter(self._ask_many(
+            [f'rang {chan} {vrange}'
+             for chan in self._chan_range for vrange in (0, 1)]))
         for chan in self._chan_range:
-            self.vranges.update(
-                {chan: {0: self._get_minmax_outputvoltage(chan, 0),
-                        1: self._get_minmax_outputvoltage(chan, 1)}})
-        self.write('ver 0')
+            self.vranges[chan] = {0: _parse_minmax(next(responses)),
+                                  1: _parse_minmax(next(responses))}
+        self._set_verbose(False)
+        # Same limits as vranges, indexed [chan-1, vrange, 0 (Min) / 1 (Max)]
+        self._vranges_arr = np.array(
+            [[[self.vranges[chan][vrange]['Min'],
+               self.vranges[chan][vrange]['Max']] for vrange in (0, 1)]
+             for chan in self._chan_range])
+
+    def _set_verbose(self, verbose: bool) -> None:
+        """
+        Switch the verbose mode of the instrument, unless it is already
+        known to be in that mode.
+        """
+        if self._verbose is verbose:
+            return
+        self.write(f'ver {int(verbose)}')
+        self._verbose = verbose
 
     def write(self, cmd: str) -> None:
         """
@@ -778,14 +1022,52 @@ class QDac(VisaInstrument):
         In this method we expect to read one termination char per command. As
         commands are concatenated by `;` we count the number of concatenated
         commands as count(';') + 1 e.g. 'wav 1 1 1 0;fun 2 1 100 1 1' is two
-        commands. Note that only the response of the last command will be
-        available in `_write_response`
+        commands.
         """
 
         LOG.debug(f"Writing to instrument {self.name}: {cmd}")
+        self._last_status_time = 0.0
+        self._last_currents_time = 0.0
         self.visa_handle.write(cmd)
-        for _ in range(cmd.count(';')+1):
-            self._write_response = self.visa_handle.read()
+        self._write_response = self._read_responses(cmd.count(';')+1)[-1]
+
+    def _write_many(self, cmds: Sequence[str]) -> None:
+        """
+        Write the commands concatenated by `;` into compound messages of at
+        most `max_cmds_per_write` commands, instead of one write per command.
+        """
+        for start in range(0, len(cmds), self.max_cmds_per_write):
+            self.write(';'.join(cmds[start:start+self.max_cmds_per_write]))
+
+    def _ask_many(self, cmds: Sequence[str]) -> List[str]:
+        """
+        Like `_write_many`, but returns the responses to all the commands.
+        """
+        responses = []
+        for start in range(0, len(cmds), self.max_cmds_per_write):
+            chunk = cmds[start:start+self.max_cmds_per_write]
+            cmd = ';'.join(chunk)
+            LOG.debug(f"Writing to instrument {self.name}: {cmd}")
+            self.visa_handle.write(cmd)
+            responses.extend(self._read_responses(len(chunk)))
+        self._write_response = responses[-1] if responses else ''
+        return responses
+
+    def _read_responses(self, num_responses: int) -> List[str]:
+        """
+        Read the responses to `num_responses` commands, one line each. With
+        verbose mode off the responses are short, and all of them are read
+        in bulk as they arrive rather than with one read per line.
+        """
+        handle = self.visa_handle
+        if num_responses == 1 or self._verbose is not False:
+            return [handle.read() for _ in range(num_responses)]
+        termination = handle.read_termination
+        unparsed = ''
+        while unparsed.count(termination) < num_responses:
+            num_bytes = max(handle.bytes_in_buffer, 1)
+            unparsed += handle.read_bytes(num_bytes).decode(handle.encoding)
+        return unparsed.split(termination)[:num_responses]
 
     def read(self) -> str:
         return self.visa_handle.read()
@@ -802,15 +1084,17 @@ class QDac(VisaInstrument):
         Usually, the response to `*IDN?` is printed. Here, the
         software version is printed.
         """
-        self.visa_handle.write('version')
         LOG.info('Connected to QDAC on {}, {}'.format(
-                                    self._address, self.visa_handle.read()))
+                                    self._address, self._fw_version_reply))
 
     def _get_firmware_version(self) -> float:
         """
         Check if the "version" command reponds. If so we probbaly have a QDevil
         QDAC, and the version number is returned. Otherwise 0.0 is returned.
+        The instrument is only asked the first time.
         """
+        if self._fw_version is not None:
+            return self._fw_version
         self.write('version')
         fw_str = self._write_response
         if ((not ("Unrecognized command" in fw_str))
@@ -819,15 +1103,20 @@ class QDac(VisaInstrument):
                 self._write_response.replace("Software Version: ", ""))
         else:
             fw_version = 0.0
+        self._fw_version = fw_version
+        self._fw_version_reply = fw_str
         return fw_version
 
     def _get_number_of_channels(self) -> int:
         """
-        Returns the number of channels for the instrument
+        Returns the number of channels for the instrument. The instrument is
+        only asked the first time.
         """
-        self.write('boardNum')
-        fw_str = self._write_response
-        return 8*int(fw_str.strip("numberOfBoards:"))
+        if self._num_channels is None:
+            self.write('boardNum')
+            fw_str = self._write_response
+            self._num_channels = 8*int(fw_str.strip("numberOfBoards:"))
+        return self._num_channels
 
     def print_overview(self, update_currents: bool =  False) -> None:
         """
@@ -836,30 +1125,25 @@ class QDac(VisaInstrument):
 
         self._update_cache(update_currents=update_currents)
 
-        for ii in range(self.num_chans):
-            line = f"Channel {ii+1} \n"
-            line += "    Voltage: {} ({}).\n".format(
-                self.channels[ii].v.cache(), self.channels[ii].v.unit
-            )
-            line += "    Current: {} ({}).\n".format(
-                self.channels[ii].i.cache.get(get_if_invalid=False),
-                self.channels[ii].i.unit,
-            )
-            line += f"    Mode: {self.channels[ii].mode.cache().get_label()}.\n"
-            line += "    Slope: {} ({}).\n".format(
-                self.channels[ii].slope.cache(), self.channels[ii].slope.unit
-            )
-            if self.channels[ii].sync.cache() > 0:
-                line += '    Sync Out: {}, Delay: {} ({}), '\
-                        'Duration: {} ({}).\n'.format(
-                            self.channels[ii].sync.cache(),
-                            self.channels[ii].sync_delay.cache(),
-                            self.channels[ii].sync_delay.unit,
-                            self.channels[ii].sync_duration.cache(),
-                            self.channels[ii].sync_duration.unit,
-                        )
-
-            print(line)
+        blocks = []
+        for chan, channel in enumerate(self.channels, start=1):
+            v, i = channel.v, channel.i
+            slope, sync = channel.slope, channel.sync.cache()
+            line = (f"Channel {chan} \n"
+                    f"    Voltage: {v.cache()} ({v.unit}).\n"
+                    f"    Current: {i.cache.get(get_if_invalid=False)}"
+                    f" ({i.unit}).\n"
+                    f"    Mode: {channel.mode.cache().get_label()}.\n"
+                    f"    Slope: {slope.cache()} ({slope.unit}).\n")
+            if sync > 0:
+                delay, duration = channel.sync_delay, channel.sync_duration
+                line += (f"    Sync Out: {sync}, "
+                         f"Delay: {delay.cache()} ({delay.unit}), "
+                         f"Duration: {duration.cache()} ({duration.unit}).\n")
+            blocks.append(line)
+
+        # A single print for all the channels
+        print('\n'.join(blocks))
 
     def _get_functiongenerator(self, chan: int) -> int:
         """
@@ -878,32 +1162,35 @@ class QDac(VisaInstrument):
         """
         fgs_timeout = 2  # Max time to wait for next available generator
 
-        if len(self._assigned_fgs) < 8:
-            fg = min(self._fgs.difference(
-                        {g.fg for g in self._assigned_fgs.values()}))
+        # A generator already held by the channel is released first
+        old_generator = self._assigned_fgs.pop(chan, None)
+        if old_generator is not None:
+            self._free_fgs.add(old_generator.fg)
+
+        if self._free_fgs:
+            fg = min(self._free_fgs)
+            self._free_fgs.discard(fg)
             self._assigned_fgs[chan] = Generator(fg)
         else:
             # If no available fgs, see if one is soon to be ready
             # Nte, this does not handle if teh user has assigned the
             # same fg to multiple channels cheating the driver
+            # Find the first channel whose generator is ready, or will be
+            # within fgs_timeout, in a single pass
             time_now = time.time()
-            available_fgs_chans = []
-            fgs_t_end_ok = [g.t_end for chan, g
-                            in self._assigned_fgs.items()
-                            if g.t_end < time_now+fgs_timeout]
-            if len(fgs_t_end_ok) > 0:
-                first_ready_t = min(fgs_t_end_ok)
-                available_fgs_chans = [chan for chan, g
-                                       in self._assigned_fgs.items()
-                                       if g.t_end == first_ready_t]
+            first_ready_t = time_now + fgs_timeout
+            oldchan = None
+            for fg_chan, generator in self._assigned_fgs.items():
+                if generator.t_end < first_ready_t:
+                    first_ready_t = generator.t_end
+                    oldchan = fg_chan
+
+            if oldchan is not None:
                 if first_ready_t > time_now:
                     LOG.warning('''
                     Trying to ramp more channels than there are generators.\n
                     Waiting for ramp generator to be released''')
                     time.sleep(first_ready_t - time_now)
-
-            if len(available_fgs_chans) > 0:
-                oldchan = available_fgs_chans[0]
                 fg = self._assigned_fgs[oldchan].fg
                 self._assigned_fgs.pop(oldchan)
                 self._assigned_fgs[chan] = Generator(fg)
@@ -951,7 +1238,7 @@ class QDac(VisaInstrument):
             LOG.warning('Ramp time too short: {:.3f} s. Ramp time set to 2 ms.'
                         .format(ramptime))
             ramptime = 0.002
-        steps = int(ramptime*1000)
+        steps = round(ramptime*1000)
         return self.ramp_voltages_2d(
                             slow_chans=[], slow_vstart=[], slow_vend=[],
                             fast_chans=channellist, fast_vstart=v_startlist,
@@ -1002,15 +1289,16 @@ class QDac(VisaInstrument):
         """
         channellist = [*slow_chans, *fast_chans]
         v_endlist = [*slow_vend, *fast_vend]
-        v_startlist = [*slow_vstart, *fast_vstart]
-        step_length_ms = int(step_length*1000)
+        step_length_ms = round(step_length*1000)
 
         if step_length < 0.001:
             LOG.warning('step_length too short: {:.3f} s. \nstep_length set to'
                         .format(step_length_ms) + ' minimum (1ms).')
             step_length_ms = 1
 
-        if any([ch in fast_chans for ch in slow_chans]):
+        slow_set = frozenset(slow_chans)
+        fast_set = frozenset(fast_chans)
+        if not slow_set.isdisjoint(fast_set):
             raise ValueError(
                     'Channel cannot be in both slow_chans and fast_chans!')
 
@@ -1020,24 +1308,28 @@ class QDac(VisaInstrument):
                     'Number of channels and number of voltages inconsistent!')
 
         for chan in channellist:
-            if chan not in range(1, self.num_chans+1):
+            if not 1 <= chan <= self.num_chans:
                 raise ValueError(
                         f'Channel number must be 1-{self.num_chans}.')
             if not (chan in self._assigned_fgs):
                 self._get_functiongenerator(chan)
 
         # Voltage validation
-        for i in range(no_channels):
-            self.channels[channellist[i]-1].v.validate(v_endlist[i])
-        if v_startlist:
-            for i in range(no_channels):
-                self.channels[channellist[i]-1].v.validate(v_startlist[i])
-
-        # Get start voltages if not provided
-        if not slow_vstart:
-            slow_vstart = [self.channels[ch-1].v.get() for ch in slow_chans]
-        if not fast_vstart:
-            fast_vstart = [self.channels[ch-1].v.get() for ch in fast_chans]
+        self._validate_voltages(channellist, v_endlist)
+        if slow_vstart:
+            self._validate_voltages(slow_chans, slow_vstart)
+        if fast_vstart:
+            self._validate_voltages(fast_chans, fast_vstart)
+
+        # Get start voltages if not provided, all in compound queries
+        missing_chans = [*(() if slow_vstart else slow_chans),
+                         *(() if fast_vstart else fast_chans)]
+        if missing_chans:
+            voltages = iter(self._get_voltages(missing_chans))
+            if not slow_vstart:
+                slow_vstart = [next(voltages) for _ in slow_chans]
+            if not fast_vstart:
+                fast_vstart = [next(voltages) for _ in fast_chans]
 
         v_startlist = [*slow_vstart, *fast_vstart]
         if no_channels != len(v_startlist):
@@ -1052,44 +1344,50 @@ class QDac(VisaInstrument):
             trigger = int(min(self._trigs.difference(
                                     set(self._assigned_triggers.values()))))
 
-        # Make sure any sync outputs are configured
+        # All the commands of the ramp (sync outputs, generators and trigger)
+        # are sent together in compound messages at the end
+        cmds = []
+
+        # Make sure any sync outputs are configured. The sync delays and
+        # durations are manual parameters, so no communication is needed to
+        # get them
         for chan in channellist:
             if chan in self._syncoutputs:
-                sync = self._syncoutputs[chan]
-                sync_duration = int(
-                                1000*self.channels[chan-1].sync_duration.get())
-                sync_delay = int(1000*self.channels[chan-1].sync_delay.get())
-                self.write('syn {} {} {} {}'.format(
-                                            sync, self._assigned_fgs[chan].fg,
-                                            sync_delay, sync_duration))
+                channel = self.channels[chan-1]
+                sync_duration = round(1000*channel.sync_duration.cache())
+                sync_delay = round(1000*channel.sync_delay.cache())
+                cmds.append('syn {} {} {} {}'.format(
+                                self._syncoutputs[chan],
+                                self._assigned_fgs[chan].fg,
+                                sync_delay, sync_duration))
 
         # Now program the channel amplitudes and function generators
-        msg = ''
-        for i in range(no_channels):
-            amplitude = v_endlist[i]-v_startlist[i]
-            ch = channellist[i]
-            fg = self._assigned_fgs[ch].fg
+        staircase = Waveform.staircase
+        assigned_fgs = self._assigned_fgs
+        channels = self.channels
+        for ch, v_start, v_end in zip(channellist, v_startlist, v_endlist):
+            amplitude = v_end-v_start
+            fg = assigned_fgs[ch].fg
             if trigger > 0:  # Trigger 0 is not a trigger
                 self._assigned_triggers[fg] = trigger
-            msg += f"wav {ch} {fg} {amplitude} {v_startlist[i]}"
             # using staircase = function 4
-            nsteps = slow_steps if ch in slow_chans else fast_steps
-            repetitions = slow_steps if ch in fast_chans else 1
+            nsteps = slow_steps if ch in slow_set else fast_steps
+            repetitions = slow_steps if ch in fast_set else 1
 
             delay = step_length_ms \
-                if ch in fast_chans else fast_steps*step_length_ms
-            msg += ';fun {} {} {} {} {} {};'.format(
-                        fg, Waveform.staircase, delay, int(nsteps),
-                        repetitions, trigger)
+                if ch in fast_set else fast_steps*step_length_ms
+            cmds.append(_WAV_TMPL.format(ch, fg, amplitude, v_start))
+            cmds.append(_FUN_TMPL.format(fg, staircase, delay,
+                                         int(nsteps), repetitions, trigger))
             # Update latest values to ramp end values
             # (actually not necessary when called from _set_voltage)
-            self.channels[ch-1].v.cache.set(v_endlist[i])
-        self.write(msg[:-1])  # last semicolon is stripped
+            channels[ch-1].v.cache.set(v_end)
 
         # Fire trigger to start generators simultaneously, saving communication
         # time by not using triggers for single channel ramping
         if trigger > 0:
-            self.write(f'trig {trigger}')
+            cmds.append(f'trig {trigger}')
+        self._write_many(cmds)
 
         # Update fgs dict so that we know when the ramp is supposed to end
         time_ramp = slow_steps * fast_steps * step_length_ms / 1000
@@ -11,6 +11,7 @@ from hypothesis import HealthCheck, given, settings
 from qcodes import config, validators
 from qcodes.dataset import (
     ArraySweep,
+    GeomSweep,
     LinSweep,
     LogSweep,
     do0d,
@@ -1015,6 +1016,84 @@ def test_linear_sweep_get_setpoints(_param):
     )
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+@pytest.mark.parametrize("endpoint", [True, False])
+@pytest.mark.parametrize("num_points", [0, 1, 2, 7, 101])
+@pytest.mark.parametrize(
+    "start, stop", [(0, 1), (-3.3, 2.1), (1.5, 1.5), (2, -5), (0, -10)]
+)
+def test_sweep_setpoints_match_numpy(
+    _param, start, stop, num_points, endpoint, dtype
+):
+    lin_sweep = LinSweep(
+        _param, start, stop, num_points, endpoint=endpoint, dtype=dtype
+    )
+    expected = np.linspace(start, stop, num_points, endpoint=endpoint, dtype=dtype)
+    assert lin_sweep.get_setpoints().dtype == expected.dtype
+    np.testing.assert_array_equal(lin_sweep.get_setpoints(), expected)
+
+    log_sweep = LogSweep(
+        _param, start, stop, num_points, endpoint=endpoint, dtype=dtype
+    )
+    expected = np.logspace(start, stop, num_points, endpoint=endpoint, dtype=dtype)
+    assert log_sweep.get_setpoints().dtype == expected.dtype
+    np.testing.assert_array_equal(log_sweep.get_setpoints(), expected)
+
+
+@pytest.mark.parametrize("sweep_class", [LinSweep, LogSweep])
+def test_sweep_negative_num_points_raises(_param, sweep_class):
+    with pytest.raises(ValueError, match="must be non-negative"):
+        sweep_class(_param, 0, 1, -1)
+
+
+@pytest.mark.parametrize("sweep_class", [LinSweep, LogSweep])
+def test_sweep_setpoints_dtype(_param, sweep_class):
+    sweep = sweep_class(_param, 0, 1, 5, dtype=np.float32)
+    assert sweep.get_setpoints().dtype == np.float32
+    assert sweep_class(_param, 0, 1, 5).get_setpoints().dtype == np.float64
+
+
+def test_sweep_setpoints_are_cached_and_read_only(_param):
+    array = np.linspace(0, 1, 5)
+    sweeps = (
+        LinSweep(_param, 0, 1, 5),
+        LogSweep(_param, 0, 1, 5),
+        ArraySweep(_param, array),
+    )
+    for sweep in sweeps:
+        setpoints = sweep.get_setpoints()
+        assert setpoints is sweep.get_setpoints()
+        assert not setpoints.flags.writeable
+        with pytest.raises(ValueError):
+            setpoints[0] = 42
+
+    # the array passed to ArraySweep must remain writable for its owner
+    assert array.flags.writeable
+
+
+def test_sweep_get_setpoints_batched(_param):
+    sweep = LinSweep(_param, 0, 1, 10)
+    blocks = list(sweep.get_setpoints_batched(4))
+
+    assert [len(block) for block in blocks] == [4, 4, 2]
+    np.testing.assert_array_equal(np.concatenate(blocks), sweep.get_setpoints())
+    assert all(np.shares_memory(block, sweep.get_setpoints()) for block in blocks)
+
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(sweep.get_setpoints_batched(0))
+
+
+def test_sweep_fill_setpoints(_param):
+    sweep = LogSweep(_param, 0, 1, 5)
+
+    out = np.empty(5, dtype=np.float32)
+    sweep.fill_setpoints(out)
+    np.testing.assert_array_equal(out, sweep.get_setpoints().astype(np.float32))
+
+    with pytest.raises(ValueError, match="Expected an array of shape"):
+        sweep.fill_setpoints(np.empty(4))
+
+
 def test_linear_sweep_properties(_param, _param_complex):
     start = 0
     stop = 1
@@ -1091,6 +1170,17 @@ def test_log_sweep_parameter_class(_param, _param_complex):
     assert isinstance(sweep_3.param, ParameterBase)
 
 
+def test_geom_sweep_get_setpoints(_param):
+    sweep = GeomSweep(_param, 1e-3, 10, 5, delay=1)
+
+    np.testing.assert_array_equal(sweep.get_setpoints(), np.geomspace(1e-3, 10, 5))
+    assert sweep.get_setpoints()[0] == 1e-3
+    assert sweep.get_setpoints()[-1] == 10
+    assert sweep.num_points == 5
+    assert sweep.delay == 1
+    assert sweep.param == _param
+
+
 def test_array_sweep_get_setpoints(_param):
     array = np.linspace(0, 1, 5)
     delay = 1
@@ -1108,6 +1198,22 @@ def test_array_sweep_get_setpoints(_param):
     )
 
 
+def test_array_sweep_dtype(_param):
+    sweep = ArraySweep(_param, [1, 2, 3], dtype=np.float32)
+    assert sweep.get_setpoints().dtype == np.float32
+
+    assert ArraySweep(_param, [1, 2.5, 3]).get_setpoints().dtype == np.float64
+
+    with pytest.raises(TypeError, match="dtype object"):
+        ArraySweep(_param, [1, None, 3])
+
+    with pytest.raises(ValueError, match="one dimensional"):
+        ArraySweep(_param, 3.0)
+
+    with pytest.raises(ValueError, match="one dimensional"):
+        ArraySweep(_param, [[1, 2], [3, 4]])
+
+
 def test_array_sweep_properties(_param):
     array = np.linspace(0, 1, 5)
     delay = 1
@@ -1443,19 +1549,19 @@ def test_dond_1d_output_data(_param, _param_complex, _param_set):
     loaded_data_1 = data_1.get_parameter_data()
 
     np.testing.assert_array_equal(
-        loaded_data_1[_param.name][_param.name], np.ones(sweep_1._num_points)
+        loaded_data_1[_param.name][_param.name], np.ones(sweep_1.num_points)
     )
     np.testing.assert_array_equal(
         loaded_data_1[_param_complex.name][_param_complex.name],
-        (1 + 1j) * np.ones(sweep_1._num_points),
+        (1 + 1j) * np.ones(sweep_1.num_points),
     )
     np.testing.assert_array_equal(
         loaded_data_1[_param_complex.name][_param_set.name],
-        np.linspace(sweep_1._start, sweep_1._stop, sweep_1._num_points),
+        np.linspace(sweep_1._start, sweep_1._stop, sweep_1.num_points),
     )
     np.testing.assert_array_equal(
         loaded_data_1[_param.name][_param_set.name],
-        np.linspace(sweep_1._start, sweep_1._stop, sweep_1._num_points),
+        np.linspace(sweep_1._start, sweep_1._stop, sweep_1.num_points),
     )
 
 
@@ -1663,30 +1769,30 @@ def test_dond_2d_output_data(_param, _param_complex, _param_set, _param_set_2):
         f"{_param_set.name},{_param_set_2.name}," f"{_param.name},{_param_complex.name}"
     )
     loaded_data_2 = data_2.get_parameter_data()
-    expected_data_2 = np.ones(25).reshape(sweep_1._num_points, sweep_2._num_points)
+    expected_data_2 = np.ones(25).reshape(sweep_1.num_points, sweep_2.num_points)
 
     np.testing.assert_array_equal(
         loaded_data_2[_param.name][_param.name], expected_data_2
     )
     expected_data_3 = (1 + 1j) * np.ones(25).reshape(
-        sweep_1._num_points, sweep_2._num_points
+        sweep_1.num_points, sweep_2.num_points
     )
     np.testing.assert_array_equal(
         loaded_data_2[_param_complex.name][_param_complex.name], expected_data_3
     )
 
     expected_setpoints_1 = np.repeat(
-        np.linspace(sweep_1._start, sweep_1._stop, sweep_1._num_points),
-        sweep_2._num_points,
-    ).reshape(sweep_1._num_points, sweep_2._num_points)
+        np.linspace(sweep_1._start, sweep_1._stop, sweep_1.num_points),
+        sweep_2.num_points,
+    ).reshape(sweep_1.num_points, sweep_2.num_points)
     np.testing.assert_array_equal(
         loaded_data_2[_param_complex.name][_param_set.name], expected_setpoints_1
     )
 
     expected_setpoints_2 = np.tile(
-        np.linspace(sweep_2._start, sweep_2._stop, sweep_2._num_points),
-        sweep_1._num_points,
-    ).reshape(sweep_1._num_points, sweep_2._num_points)
+        np.linspace(sweep_2._start, sweep_2._stop, sweep_2.num_points),
+        sweep_1.num_points,
+    ).reshape(sweep_1.num_points, sweep_2.num_points)
     np.testing.assert_array_equal(
         loaded_data_2[_param_complex.name][_param_set_2.name], expected_setpoints_2
     )
@@ -1802,13 +1908,13 @@ def test_dond_2d_multi_datasets_with_callable_output_data(
         f"{_param_2.name},{_param_complex_2.name}"
     )
     loaded_data_1 = data_1.get_parameter_data()
-    expected_data_1_1 = np.ones(25).reshape(sweep_1._num_points, sweep_2._num_points)
+    expected_data_1_1 = np.ones(25).reshape(sweep_1.num_points, sweep_2.num_points)
 
     np.testing.assert_array_equal(
         loaded_data_1[_param.name][_param.name], expected_data_1_1
     )
     expected_data_1_2 = (1 + 1j) * np.ones(25).reshape(
-        sweep_1._num_points, sweep_2._num_points
+        sweep_1.num_points, sweep_2.num_points
     )
     np.testing.assert_array_equal(
         loaded_data_1[_param_complex.name][_param_complex.name], expected_data_1_2
@@ -1816,28 +1922,28 @@ def test_dond_2d_multi_datasets_with_callable_output_data(
 
     loaded_data_2 = data_2.get_parameter_data()
     expected_data_2_1 = 2 * np.ones(25).reshape(
-        sweep_1._num_points, sweep_2._num_points
+        sweep_1.num_points, sweep_2.num_points
     )
 
     np.testing.assert_array_equal(
         loaded_data_2[_param_2.name][_param_2.name], expected_data_2_1
     )
     expected_data_2_2 = (2 + 2j) * np.ones(25).reshape(
-        sweep_1._num_points, sweep_2._num_points
+        sweep_1.num_points, sweep_2.num_points
     )
     np.testing.assert_array_equal(
         loaded_data_2[_param_complex_2.name][_param_complex_2.name], expected_data_2_2
     )
 
     expected_setpoints_1 = np.repeat(
-        np.linspace(sweep_1._start, sweep_1._stop, sweep_1._num_points),
-        sweep_2._num_points,
-    ).reshape(sweep_1._num_points, sweep_2._num_points)
+        np.linspace(sweep_1._start, sweep_1._stop, sweep_1.num_points),
+        sweep_2.num_points,
+    ).reshape(sweep_1.num_points, sweep_2.num_points)
 
     expected_setpoints_2 = np.tile(
-        np.linspace(sweep_2._start, sweep_2._stop, sweep_2._num_points),
-        sweep_1._num_points,
-    ).reshape(sweep_1._num_points, sweep_2._num_points)
+        np.linspace(sweep_2._start, sweep_2._stop, sweep_2.num_points),
+        sweep_1.num_points,
+    ).reshape(sweep_1.num_points, sweep_2.num_points)
 
     np.testing.assert_array_equal(
         loaded_data_1[_param_complex.name][_param_set.name], expected_setpoints_1
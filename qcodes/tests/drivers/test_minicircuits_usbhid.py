@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import qcodes.instrument_drivers.Minicircuits.USBHIDMixin as usbhid_module
+from qcodes.instrument_drivers.Minicircuits.RUDAT_13G_90 import RUDAT_13G_90_USB
+
+
+class FakeHidDevice:
+    """
+    Stand-in for a pywinusb HID device that answers every query with
+    ``reply`` through the registered raw data handler.
+    """
+
+    def __init__(self, reply: str = "42") -> None:
+        self.reply = reply
+        self.accept_reports = True
+        self.sent: list[bytes] = []
+        self._handler = None
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def set_raw_data_handler(self, handler) -> None:
+        self._handler = handler
+
+    def send_output_report(self, data) -> bool:
+        self.sent.append(bytes(data))
+        if self.accept_reports and data[2:].rstrip(b"\x00").endswith(b"?"):
+            self._handler(bytes([0, 1]) + self.reply.encode().ljust(63, b"\x00"))
+        return self.accept_reports
+
+
+@pytest.fixture(name="mock_hid")
+def _make_mock_hid(monkeypatch):
+    hid = MagicMock()
+    monkeypatch.setattr(usbhid_module, "hid", hid)
+    monkeypatch.setattr(
+        usbhid_module.USBHIDMixin, "_check_hid_import", staticmethod(lambda: None)
+    )
+    return hid
+
+
+@pytest.fixture(name="fake_device")
+def _make_fake_device(mock_hid):
+    device = FakeHidDevice()
+    mock_hid.HidDeviceFilter.return_value.get_devices.return_value = [device]
+    return device
+
+
+@pytest.fixture(name="rudat")
+def _make_rudat(fake_device):
+    inst = RUDAT_13G_90_USB("rudat")
+    try:
+        yield inst
+    finally:
+        inst.close()
+
+
+def test_enumerate_devices_filters_on_product_and_vendor_id(mock_hid):
+    device = MagicMock()
+    device.instance_id = "my_instance"
+    mock_hid.HidDeviceFilter.return_value.get_devices.return_value = [device]
+
+    assert RUDAT_13G_90_USB.enumerate_devices() == ["my_instance"]
+    mock_hid.HidDeviceFilter.assert_called_once_with(
+        product_id=RUDAT_13G_90_USB.product_id,
+        vendor_id=RUDAT_13G_90_USB.vendor_id,
+    )
+
+
+def test_ask_returns_reply(rudat, fake_device):
+    fake_device.reply = "RUDAT-13G-90"
+    assert rudat.ask(":MN?") == "RUDAT-13G-90"
+
+    with pytest.raises(ValueError, match="Expected a response of 65 B"):
+        rudat._unpack_string(b"\x00\x01abc")
+
+
+def test_write_raw_batch_sends_one_report_per_command(rudat, fake_device):
+    fake_device.sent.clear()
+
+    # A short command after a longer one must not keep the longer tail in
+    # the reused report buffer
+    rudat.write_raw_batch([":SETATT=12.75", ":SETATT=2"])
+    assert fake_device.sent == [
+        b"\x00\x01:SETATT=12.75" + b"\x00" * 50,
+        b"\x00\x01:SETATT=2" + b"\x00" * 54,
+    ]
+
+    fake_device.accept_reports = False
+    with pytest.raises(RuntimeError, match=":SETATT=3"):
+        rudat.write_raw_batch([":SETATT=3"])
+
+
+def test_close_removes_the_instrument(fake_device):
+    inst = RUDAT_13G_90_USB("rudat_to_close")
+    assert RUDAT_13G_90_USB.exist("rudat_to_close")
+
+    inst.close()
+    assert not RUDAT_13G_90_USB.exist("rudat_to_close")
+    RUDAT_13G_90_USB("rudat_to_close").close()
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import pytest
+from pyvisa.resources.serial import SerialInstrument
+
+from qcodes.instrument_drivers.QDevil.QDevil_QDAC import Mode, QDac
+
+
+class FakeQDacHandle(SerialInstrument):
+    """
+    Stand-in for the serial VISA resource of a QDevil QDAC with firmware
+    1.07. Every command gets a reply line, and replies become readable in
+    chunks of ``arrival_size`` bytes to mimic a slow serial line.
+    """
+
+    baud_rate = None
+    parity = None
+    data_bits = None
+    write_termination = "\n"
+    read_termination = "\n"
+    encoding = "ascii"
+    timeout = 2000
+    chunk_size = 20 * 1024
+
+    def __init__(self, num_boards: int = 3, arrival_size: int = 7) -> None:
+        self.num_chans = 8 * num_boards
+        self.num_boards = num_boards
+        self.arrival_size = arrival_size
+        self.v = {chan: 0.0 for chan in range(1, self.num_chans + 1)}
+        self.vrange = {chan: 0 for chan in range(1, self.num_chans + 1)}
+        self.irange = {chan: 1 for chan in range(1, self.num_chans + 1)}
+        self.wav = {chan: (0, 0.0, 0.0) for chan in range(1, self.num_chans + 1)}
+        self.fun = {fg: (4, 1, 1, 1, 0, 0) for fg in range(1, 9)}
+        self.syn = {syn: (0, 0, 0) for syn in range(1, 6)}
+        self.verbose = True
+        self.writes: list[str] = []
+        self._buffer = b""
+
+    def __del__(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        self._buffer = b""
+
+    def flush(self, mask) -> None:
+        self._buffer = b""
+
+    def write(self, message, termination=None, encoding=None):
+        self.writes.append(message)
+        for cmd in message.split(";"):
+            self._buffer += self._reply(cmd.split()).encode() + b"\n"
+
+    def read(self, termination=None, encoding=None):
+        if b"\n" not in self._buffer:
+            raise TimeoutError("No reply line to read")
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.decode()
+
+    @property
+    def bytes_in_buffer(self) -> int:
+        return min(len(self._buffer), self.arrival_size)
+
+    def read_bytes(self, count, chunk_size=None, break_on_termchar=False):
+        if count > len(self._buffer):
+            raise TimeoutError("Not enough bytes to read")
+        data, self._buffer = self._buffer[:count], self._buffer[count:]
+        return data
+
+    def _reply(self, words: list[str]) -> str:
+        cmd, args = words[0], [float(arg) for arg in words[1:]]
+        chan = int(args[0]) if args else 0
+        if cmd == "version":
+            return "Software Version: 1.07"
+        if cmd == "boardNum":
+            return f"numberOfBoards:{self.num_boards}"
+        if cmd == "ver":
+            self.verbose = chan == 1
+            return "OK" if self.verbose else ""
+        if cmd == "rang":
+            limit = (9.9 if args[1] == 0 else 1.09) + chan / 1000
+            return f"MIN: {-limit:.6f} MAX: {limit:.6f}"
+        if cmd == "status":
+            lines = ["Software Version: 1.07\r",
+                     "Channel\tOut V\t\tVoltage range\tCurrent range", ""]
+            for status_chan in range(self.num_chans, 0, -1):
+                vrange = "X 1" if self.vrange[status_chan] == 0 else "X 0.1"
+                irange = "hi cur" if self.irange[status_chan] else "lo cur"
+                lines.append(f"{status_chan}\t{self.v[status_chan]: .6f}"
+                             f"\t\t{vrange}\t\t{irange}")
+            return "\n".join(lines)
+        if cmd == "set":
+            if len(args) == 1:
+                return f"{self.v[chan]:.6f}"
+            self.v[chan] = args[1]
+        elif cmd == "get":
+            return f"{0.5 * chan:.6f}"
+        elif cmd == "wav":
+            if len(args) == 1:
+                fg, amplitude, offset = self.wav[chan]
+                return f"{fg},{amplitude:.6f},{offset:.6f}"
+            self.wav[chan] = (int(args[1]), args[2], args[3])
+            if args[1] > 0:
+                self.v[chan] = args[3]
+        elif cmd == "fun":
+            if len(args) == 1:
+                return ",".join(str(value) for value in self.fun[chan])
+            waveform, step, steps, rep, trigger = map(int, args[1:6])
+            self.fun[chan] = (waveform, step, steps, rep, rep, trigger)
+        elif cmd == "syn":
+            if len(args) == 1:
+                return ",".join(str(value) for value in self.syn[chan])
+            self.syn[chan] = tuple(int(arg) for arg in args[1:4])
+        elif cmd == "vol":
+            self.vrange[chan] = int(args[1])
+        elif cmd == "cur":
+            self.irange[chan] = int(args[1])
+        elif cmd == "tem":
+            return f"{20 + args[0] + args[1] / 10:.3f}"
+        elif cmd not in ("cal", "trig"):
+            return "Unrecognized command"
+        return ""
+
+
+class QDacWithFakeHandle(QDac):
+    """
+    QDac connected to a FakeQDacHandle instead of a VISA resource.
+    """
+
+    def __init__(self, name: str, handle: FakeQDacHandle, **kwargs) -> None:
+        self._fake_handle = handle
+        super().__init__(name, "ASRL1::INSTR", **kwargs)
+
+    def _open_resource(self, address, visalib):
+        return self._fake_handle, "fake"
+
+
+@pytest.fixture(name="handle")
+def _make_handle():
+    return FakeQDacHandle()
+
+
+@pytest.fixture(name="qdac")
+def _make_qdac(handle):
+    qdac = QDacWithFakeHandle("qdac", handle)
+    try:
+        yield qdac
+    finally:
+        qdac.close()
+
+
+def test_init_reads_ranges_and_status(qdac, handle):
+    assert "rang 1 0;rang 1 1;rang 2 0;rang 2 1" in handle.writes[3]
+    assert qdac.vranges[3][1] == {"Min": -1.093, "Max": 1.093}
+    assert qdac.num_chans == 24
+    assert handle.verbose is False
+
+    for channel in qdac.channels:
+        assert channel.v.cache() == 0
+        assert channel.mode.cache() is Mode.vhigh_ihigh
+    assert qdac.ch03.v.vals.max_value == pytest.approx(9.903)
+
+
+def test_minmax_outputvoltage_returns_a_copy(qdac, handle):
+    handle.writes.clear()
+
+    minmax = qdac._get_minmax_outputvoltage(3, 1)
+    assert minmax == {"Min": -1.093, "Max": 1.093}
+    assert handle.writes == []
+
+    minmax["Max"] = 0
+    assert qdac.vranges[3][1] == {"Min": -1.093, "Max": 1.093}
+
+
+def test_set_voltage(qdac, handle):
+    qdac.ch01.v(0.5)
+
+    assert handle.writes[-1] == "wav 1 0 0 0;set 1 0.500000"
+    assert handle.v[1] == 0.5
+    assert qdac.ch01.v.cache() == 0.5
+
+
+def test_reset(qdac, handle):
+    qdac.ch02.v(0.5)
+    qdac.ch03.sync(1)
+    qdac.ramp_voltages([4], [0.0], [1.0], 10)
+    handle.writes.clear()
+
+    qdac.reset()
+
+    cmds = ";".join(handle.writes[2:]).split(";")
+    assert cmds[:8] == ["wav 1 0 0 0", "set 1 0", "vol 1 0", "cur 1 1",
+                        "wav 2 0 0 0", "set 2 0", "vol 2 0", "cur 2 1"]
+    assert cmds[-2:] == ["syn 1 0 0 0", "syn 2 0 0 0"]
+    assert len(cmds) == 4 * 24 + 2
+    assert all(v_set == 0 for v_set in handle.v.values())
+    assert handle.wav[4] == (0, 0.0, 0.0)
+    assert handle.syn[1] == (0, 0, 0)
+    assert qdac.ch02.v.cache() == 0
+    assert qdac.ch03.sync.cache() == 0
+    assert qdac._assigned_fgs == {}
+    assert qdac._syncoutputs == {}
+
+
+def test_reset_keeps_parameter_step(qdac, handle):
+    qdac.ch01.v(0.25)
+    qdac.ch01.v.step = 0.1
+    handle.writes.clear()
+
+    qdac.reset()
+
+    v_writes = [write for write in handle.writes if write.startswith("wav 1 ")]
+    assert v_writes[-2:] == ["wav 1 0 0 0;set 1 0.050000",
+                             "wav 1 0 0 0;set 1 0.000000"]
+    assert "set 1 0" not in ";".join(handle.writes).split(";")
+    assert handle.v[1] == 0
+    assert qdac.ch01.v.cache() == 0
+
+
+def test_multi_channel_set(qdac, handle):
+    handle.writes.clear()
+
+    qdac.channels[0:2].v(0.35)
+    assert handle.writes == ["wav 1 0 0 0;set 1 0.350000;"
+                             "wav 2 0 0 0;set 2 0.350000"]
+    assert qdac.ch02.v.cache() == 0.35
+
+
+def test_multi_channel_set_respects_max_cmds_per_write():
+    handle = FakeQDacHandle(num_boards=6)
+    qdac = QDacWithFakeHandle("qdac48", handle)
+    try:
+        handle.writes.clear()
+        qdac.channels.v(0.1)
+
+        assert len(handle.writes) == 5
+        assert all(write.count(";") < qdac.max_cmds_per_write
+                   for write in handle.writes)
+        assert all(v_set == 0.1 for v_set in handle.v.values())
+    finally:
+        qdac.close()
+
+
+def test_multi_channel_set_keeps_parameter_step(qdac, handle):
+    qdac.ch01.v.step = 0.1
+    handle.writes.clear()
+
+    qdac.channels[0:2].v(0.35)
+    assert [write for write in handle.writes if write != "status"] == [
+        f"wav 1 0 0 0;set 1 {v_set:.6f}" for v_set in (0.1, 0.2, 0.3, 0.35)
+    ] + ["wav 2 0 0 0;set 2 0.350000"]
+    assert qdac.ch01.v.cache() == 0.35
+
+
+def test_ask_many_returns_every_response(qdac, handle):
+    for chan in range(1, 25):
+        handle.v[chan] = chan / 100
+    handle.writes.clear()
+
+    responses = qdac._ask_many([f"set {chan}" for chan in range(1, 25)])
+
+    assert responses == [f"{chan / 100:.6f}" for chan in range(1, 25)]
+    assert handle.writes == [
+        ";".join(f"set {chan}" for chan in range(1, 23)),
+        ";".join(f"set {chan}" for chan in range(23, 25)),
+    ]
+    assert qdac._write_response == "0.240000"
+
+
+def test_multi_channel_get(qdac, handle):
+    handle.v[2] = 0.25
+    handle.vrange[2] = 1
+    handle.irange[2] = 0
+    handle.writes.clear()
+
+    assert qdac.channels[0:3].i.get() == (0.5e-6, 1e-6, 1.5e-6)
+    assert handle.writes == ["get 1;get 2;get 3"]
+    assert qdac.ch02.i.cache() == 1e-6
+
+    qdac._last_status_time = 0.0
+    assert qdac.channels[0:3].v.get() == (0.0, 0.25, 0.0)
+    assert qdac.ch02.mode.cache() is Mode.vlow_ilow
+    assert qdac.ch02.v.vals.max_value == pytest.approx(1.092)
+
+
+def test_status_is_reused_until_written(qdac, handle):
+    qdac._last_status_time = 0.0
+    handle.writes.clear()
+
+    qdac.channels.v.get()
+    qdac.channels.v.get()
+    assert handle.writes.count("status") == 1
+
+    qdac.ch01.v(0.1)
+    handle.writes.clear()
+    assert qdac.channels[0:1].v.get() == (0.1,)
+    assert handle.writes == ["status"]
+
+
+def test_channel_snapshot_rereads_status_while_ramping(qdac, handle):
+    qdac._update_cache()
+    handle.writes.clear()
+    qdac.ch01.snapshot(update=True)
+    assert handle.writes == []
+
+    qdac.ramp_voltages([5], [0.0], [1.0], 10)
+    qdac._update_cache()
+    handle.v[5] = 0.3
+    handle.writes.clear()
+    qdac.ch05.snapshot(update=True)
+    assert handle.writes == ["status"]
+    assert qdac.ch05.v.cache() == 0.3
+
+
+def test_channel_snapshot_rereads_stale_currents(handle):
+    qdac = QDacWithFakeHandle("qdac", handle, update_currents=True)
+    try:
+        # The write makes the currents stale, the get reads the status only
+        qdac.ch05.v(0.2)
+        qdac.channels.v.get()
+        handle.writes.clear()
+        qdac.ch01.snapshot(update=True)
+        assert handle.writes[0] == "status"
+        assert "get 1" in handle.writes
+
+        handle.writes.clear()
+        qdac.ch02.snapshot(update=True)
+        assert handle.writes == []
+        assert qdac.ch02.i.cache() == 1e-6
+    finally:
+        qdac.close()
+
+
+def test_sync_port_moves_between_channels(qdac, handle):
+    qdac.ch01.sync(1)
+    qdac.ch02.sync(2)
+    handle.writes.clear()
+
+    # Taking a port used by another channel releases it from that channel
+    qdac.ch03.sync(1)
+    assert handle.writes == ["syn 1 0 0 0"]
+    assert qdac._syncoutputs == {2: 2, 3: 1}
+    assert qdac.ch01.sync() == 0
+    assert qdac.ch03.sync() == 1
+
+    # Moving a channel to a port in use releases both old assignments
+    handle.writes.clear()
+    qdac.ch02.sync(1)
+    assert handle.writes == ["syn 2 0 0 0", "syn 1 0 0 0"]
+    assert qdac._syncoutputs == {2: 1}
+    assert qdac._sync_to_chan == {1: 2}
+    assert qdac.ch03.sync() == 0
+
+    qdac.ch02.sync(0)
+    assert qdac._syncoutputs == {}
+    assert qdac._sync_to_chan == {}
+
+
+def test_get_functiongenerator_releases_the_old_generator(qdac):
+    qdac._get_functiongenerator(5)
+    qdac._get_functiongenerator(6)
+    qdac._get_functiongenerator(5)
+
+    assert {chan: g.fg for chan, g in qdac._assigned_fgs.items()} == {
+        5: 1, 6: 2}
+    assert qdac._free_fgs == set(range(3, 9))
+
+
+def test_triggered_ramp_is_programmed_in_one_write(qdac, handle):
+    chans = list(range(1, 9))
+    for chan in chans:
+        qdac.channels[chan - 1].sync(1 + chan % 2)
+    handle.writes.clear()
+
+    qdac.ramp_voltages_2d(slow_chans=chans[:4], slow_vstart=[0.0] * 4,
+                          slow_vend=[1.0] * 4, fast_chans=chans[4:],
+                          fast_vstart=[0.0] * 4, fast_vend=[1.0] * 4,
+                          step_length=0.01, slow_steps=2, fast_steps=3)
+
+    ramp_writes = [write for write in handle.writes if "trig" in write]
+    assert len(ramp_writes) == 1
+    cmds = ramp_writes[0].split(";")
+    assert [cmd.split()[0] for cmd in cmds] == (
+        ["syn"] * 2 + ["wav", "fun"] * 8 + ["trig"])
+    assert cmds[:4] == ["syn 2 7 0 10", "syn 1 8 0 10",
+                        "wav 1 1 1.0 0.0", "fun 1 4 30 2 1 1"]
+    assert cmds[-3:] == ["wav 8 8 1.0 0.0", "fun 8 4 10 3 2 1", "trig 1"]
+    assert handle.fun[1] == (4, 30, 2, 1, 1, 1)
+
+
+def test_load_state_restores_running_ramps(qdac, handle):
+    qdac.ch05.sync(1)
+    qdac.ch05.sync_delay(0.002)
+    qdac.ch05.sync_duration(0.01)
+    qdac.ramp_voltages([5, 6], [0.1, 0.2], [1.1, 0.7], 10)
+    handle.writes.clear()
+
+    qdac2 = QDacWithFakeHandle("qdac2", handle)
+    try:
+        assert {chan: g.fg for chan, g in qdac2._assigned_fgs.items()} == {
+            5: 1, 6: 2}
+        assert qdac2._free_fgs == set(range(3, 9))
+        assert qdac2._assigned_triggers == {1: 1, 2: 1}
+        assert qdac2.ch05.v.cache() == 0.1
+        assert qdac2.ch06.v.cache() == 0.2
+        assert qdac2.ch05.sync.cache() == 1
+        assert qdac2.ch05.sync_delay() == 0.002
+        assert qdac2.ch05.sync_duration() == 0.01
+        assert "wav 1;wav 2;wav 3" in ";".join(handle.writes)
+    finally:
+        qdac2.close()